@@ -0,0 +1,77 @@
+"""Compiled numeric kernels for the strategy hot path.
+
+The per-tick strategy math is plain scalar floating point, which numba's
+``@njit`` compiles to native code. When numba is missing the same functions
+run as ordinary Python, so the strategies call these unconditionally; the
+array-heavy survival path keeps its NumPy fallback because a Python loop
+would be slower than the vectorized form.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+    HAVE_NUMBA = False
+
+
+def _jit(func):
+    if njit is None:
+        return func
+    return njit(cache=True, fastmath=True)(func)
+
+
+@_jit
+def farm_heading(sx: float, sy: float, tx: float, ty: float) -> float:
+    """Heading in radians from the snake at (sx, sy) to a target point."""
+
+    return math.atan2(ty - sy, tx - sx)
+
+
+@_jit
+def hunt_core(sx: float, sy: float, tx: float, ty: float, aggression_sq: float):
+    """Fused heading (radians) / boost decision for a hunt target."""
+
+    dx = tx - sx
+    dy = ty - sy
+    heading = math.atan2(dy, dx)
+    boost = dx * dx + dy * dy < aggression_sq
+    return heading, boost
+
+
+@_jit
+def evade_heading(sx: float, sy: float, threats: np.ndarray) -> float:
+    """Flee heading in radians along the distance-weighted repulsion vector.
+
+    Each threat pushes away with weight 1/distance^2, so a close threat
+    dominates a distant cluster instead of every threat counting equally.
+    The summed vector already points away from the threats, so no
+    half-turn flip is needed.
+    """
+
+    push_x = 0.0
+    push_y = 0.0
+    for index in range(threats.shape[0]):
+        dx = sx - threats[index, 0]
+        dy = sy - threats[index, 1]
+        r2 = dx * dx + dy * dy
+        if r2 < 1e-9:  # coincident threat has no direction to push along
+            continue
+        push_x += dx / r2
+        push_y += dy / r2
+    heading = math.atan2(push_y, push_x)
+    if heading < 0.0:
+        heading += math.tau
+    return heading
+
+
+if HAVE_NUMBA:  # pragma: no cover - compile at import so ticks never stall
+    farm_heading(0.0, 0.0, 1.0, 1.0)
+    hunt_core(0.0, 0.0, 1.0, 1.0, 1.0)
+    evade_heading(0.0, 0.0, np.zeros((1, 2)))
@@ -3,14 +3,17 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 import time
 from typing import Dict, Optional
 
+import numpy as np
+
 from .config import BotConfig, StrategyMode
 from .planner import ActionPlanner
-from .protocol import IncomingMessage, SlitherProtocol
-from .state import Food, GameState, Snake, Vector2
-from .strategies import BaseStrategy, make_strategy
+from .protocol import IncomingMessage, SlitherProtocol, ThreadedSlitherProtocol
+from .state import GameState, Snake, Vector2, wrap_angle
+from .strategies import REASON_LABELS, BaseStrategy, make_strategy
 
 LOGGER = logging.getLogger(__name__)
 
@@ -24,8 +27,24 @@ class SlitherBot:
         self._strategy: BaseStrategy = make_strategy(self.config.mode, self.config)
         self._planner = ActionPlanner(self.config, self._strategy)
         self._protocol: Optional[SlitherProtocol] = None
-        self._last_send = 0.0
+        self._protocol_cls = (
+            ThreadedSlitherProtocol if self.config.transport == "threaded" else SlitherProtocol
+        )
+        self._last_send_ns = 0
+        self._send_rate_limit_ns = int(self.config.send_rate_limit * 1e9)
         self._plugins: Dict[str, BasePlugin] = {}
+        self._sanitized_nickname = self.config.sanitized_nickname()
+        # Reused every tick; only the payload fields change between sends.
+        self._move_envelope: Dict[str, object] = {"type": "move", "payload": {}}
+        # Constant-time dispatch instead of an if/elif chain per message.
+        self._handlers = {
+            "world": self._on_world,
+            "snake": self._on_snake,
+            "snake_leave": self._on_snake_leave,
+            "food_batch": self._on_food_batch,
+            "hazard": self._on_hazard,
+            "mode": self._on_mode,
+        }
 
     async def run(self) -> None:
         """Connect to the server and enter the main update loop."""
@@ -33,12 +52,12 @@ class SlitherBot:
         retries = 0
         while retries <= self.config.reconnect_attempts:
             try:
-                async with SlitherProtocol(self.config.server_url, self.config.heartbeat_interval) as protocol:
+                async with self._protocol_cls(self.config.server_url, self.config.heartbeat_interval) as protocol:
                     self._protocol = protocol
                     await protocol.send(
                         {
                             "type": "join",
-                            "payload": {"nickname": self.config.sanitized_nickname()},
+                            "payload": {"nickname": self._sanitized_nickname},
                         }
                     )
                     await self._loop(protocol)
@@ -50,65 +69,78 @@ class SlitherBot:
 
     async def _loop(self, protocol: SlitherProtocol) -> None:
         async for message in protocol.messages():
-            now = time.monotonic()
-            await self._handle_message(message, now)
-            await self._maybe_act(now)
+            now_ns = time.monotonic_ns()
+            await self._handle_message(message, now_ns * 1e-9)
+            await self._maybe_act(now_ns)
 
     async def _handle_message(self, message: IncomingMessage, now: float) -> None:
-        if message.type == "world" and "size" in message.payload:
+        handler = self._handlers.get(message.type)
+        if handler:
+            handler(message, now)
+
+    def _on_world(self, message: IncomingMessage, now: float) -> None:
+        if "size" in message.payload:
             self.state.world_size = tuple(message.payload["size"])  # type: ignore[assignment]
-        elif message.type == "snake" and "id" in message.payload:
-            snake = Snake(
-                id=str(message.payload["id"]),
-                position=Vector2(message.payload.get("x", 0.0), message.payload.get("y", 0.0)),
-                heading=message.payload.get("heading", 0.0),
-                length=message.payload.get("length", 0.0),
-                speed=message.payload.get("speed", self.config.movement_tuning.base_speed),
-                is_self=message.payload.get("self", False),
-                name=message.payload.get("name"),
-            )
-            self.state.update_snakes([snake])
-        elif message.type == "snake_leave":
-            self.state.remove_snake(str(message.payload.get("id")))
-        elif message.type == "food_batch":
-            foods = [
-                Food(
-                    position=Vector2(item[0], item[1]),
-                    mass=item[2],
-                    created=now,
-                )
-                for item in message.payload.get("items", [])
-            ]
-            self.state.update_food(foods)
-        elif message.type == "hazard":
-            self.state.mark_hazard(
-                center=Vector2(message.payload.get("x", 0.0), message.payload.get("y", 0.0)),
-                radius=message.payload.get("radius", 20.0),
-                expires=now + message.payload.get("duration", 2.0),
-            )
-        elif message.type == "mode":
-            mode = StrategyMode(message.payload.get("value", self.config.mode.value))
-            self.set_mode(mode)
-        self.state.decay_food(now, self.config.sensor_tuning.food_decay_seconds)
-        self.state.prune_hazards(now)
 
-    async def _maybe_act(self, now: float) -> None:
+    def _on_snake(self, message: IncomingMessage, now: float) -> None:
+        if "id" not in message.payload:
+            return
+        snake = Snake(
+            id=str(message.payload["id"]),
+            position=Vector2(message.payload.get("x", 0.0), message.payload.get("y", 0.0)),
+            heading=math.radians(message.payload.get("heading", 0.0)),
+            length=message.payload.get("length", 0.0),
+            speed=message.payload.get("speed", self.config.movement_tuning.base_speed),
+            is_self=message.payload.get("self", False),
+            name=message.payload.get("name"),
+        )
+        self.state.update_snakes([snake])
+
+    def _on_snake_leave(self, message: IncomingMessage, now: float) -> None:
+        self.state.remove_snake(str(message.payload.get("id")))
+
+    def _on_food_batch(self, message: IncomingMessage, now: float) -> None:
+        items = message.payload.get("items", [])
+        if not items:
+            return
+        # Parse straight into float32 arrays; no per-pellet objects.
+        arr = np.asarray(items, dtype=np.float32)
+        self.state.extend_food(arr[:, 0:2], arr[:, 2], now)
+
+    def _on_hazard(self, message: IncomingMessage, now: float) -> None:
+        self.state.mark_hazard(
+            center=Vector2(message.payload.get("x", 0.0), message.payload.get("y", 0.0)),
+            radius=message.payload.get("radius", 20.0),
+            expires=now + message.payload.get("duration", 2.0),
+        )
+
+    def _on_mode(self, message: IncomingMessage, now: float) -> None:
+        mode = StrategyMode(message.payload.get("value", self.config.mode.value))
+        self.set_mode(mode)
+
+    async def _maybe_act(self, now_ns: int) -> None:
         if not self._protocol:
             return
-        if now - self._last_send < self.config.send_rate_limit:
+        # Integer nanosecond arithmetic keeps the hot gate cheap and free of
+        # float rounding drift over long sessions.
+        if now_ns - self._last_send_ns < self._send_rate_limit_ns:
             return
+        now = now_ns * 1e-9
+        # Decaying food and pruning hazards rebuilds O(N) structures, so do
+        # it once per send cycle rather than for every inbound message.
+        self.state.decay_food(now, self.config.sensor_tuning.food_decay_seconds)
+        self.state.prune_hazards(now)
         plan = self._planner.step(self.state, now)
-        message = {
-            "type": "move",
-            "payload": {
-                "heading": plan.heading,
-                "boost": plan.boost,
-                "throttle": plan.throttle,
-                "reason": plan.reason,
-            },
-        }
-        await self._protocol.send(message)
-        self._last_send = now
+        payload = self._move_envelope["payload"]
+        # Internal headings are radians; the wire protocol speaks degrees.
+        # Planned headings are at most one revolution out of range, so the
+        # compare-and-correct wrap beats the float remainder here.
+        payload["heading"] = math.degrees(wrap_angle(plan.heading))
+        payload["boost"] = plan.boost
+        payload["throttle"] = plan.throttle
+        payload["reason"] = REASON_LABELS[plan.reason]
+        await self._protocol.send(self._move_envelope)
+        self._last_send_ns = now_ns
 
     def set_mode(self, mode: StrategyMode) -> None:
         LOGGER.info("Switching mode to %s", mode.value)
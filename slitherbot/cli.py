@@ -8,7 +8,7 @@ from dataclasses import replace
 from typing import Iterable
 
 from .bot import SlitherBot
-from .config import BotConfig, StrategyMode
+from .config import BotConfig, StrategyMode, parse_config_overrides
 
 
 def parse_arguments(argv: Iterable[str] | None = None) -> BotConfig:
@@ -36,14 +36,18 @@ def parse_arguments(argv: Iterable[str] | None = None) -> BotConfig:
     logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO))
     config = BotConfig(server_url=args.server, nickname=args.nickname, mode=StrategyMode(args.mode))
     if args.config:
-        overrides = BotConfig.from_iterable(args.config)
-        config = replace(config, **overrides)
-        config = BotConfig(**{**config.__dict__, **overrides.__dict__})  # type: ignore[arg-type]
+        config = replace(config, **parse_config_overrides(args.config))
     return config
 
 
 def main(argv: Iterable[str] | None = None) -> None:
     config = parse_arguments(argv)
+    try:  # uvloop roughly halves asyncio overhead; unavailable on Windows.
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     bot = SlitherBot(config)
     asyncio.run(bot.run())
 
@@ -4,7 +4,6 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, Iterable, List, Tuple
-from typing import Iterable, List, Tuple
 
 
 class StrategyMode(str, Enum):
@@ -15,6 +14,32 @@ class StrategyMode(str, Enum):
     SURVIVAL = "survival"
 
 
+#: Override keys needing a type conversion, precompiled for O(1) dispatch.
+_INT_KEYS = frozenset({"reconnect_attempts"})
+_FLOAT_KEYS = frozenset({"reconnect_backoff", "heartbeat_interval", "send_rate_limit"})
+
+
+def parse_config_overrides(args: Iterable[str]) -> Dict[str, Any]:
+    """Parse CLI style ``key=value`` overrides into BotConfig keyword arguments."""
+
+    kwargs: Dict[str, Any] = {}
+    for item in args:
+        if "=" not in item:
+            raise ValueError(f"Invalid configuration override: {item}")
+        key, value = item.split("=", 1)
+        key = key.strip()
+        value = value.strip()
+        if key == "mode":
+            kwargs[key] = StrategyMode(value)
+        elif key in _INT_KEYS:
+            kwargs[key] = int(value)
+        elif key in _FLOAT_KEYS:
+            kwargs[key] = float(value)
+        else:
+            kwargs[key] = value
+    return kwargs
+
+
 @dataclass(slots=True)
 class MovementTuning:
     """Fine tuning parameters for motion heuristics."""
@@ -50,46 +75,38 @@ class BotConfig:
     reconnect_backoff: float = 2.0
     heartbeat_interval: float = 3.5
     send_rate_limit: float = 0.03
+    transport: str = "async"  # "async" or "threaded" (needs websocket-client)
     movement_tuning: MovementTuning = field(default_factory=MovementTuning)
     sensor_tuning: SensorTuning = field(default_factory=SensorTuning)
     forbidden_names: Tuple[str, ...] = ("admin", "moderator")
     preferred_targets: Tuple[str, ...] = tuple()
     plugins: List[str] = field(default_factory=list)
+    _forbidden_lower: Tuple[str, ...] = field(init=False, repr=False)
+    _preferred_lower: Tuple[str, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Lowercase once at construction; these feed per-tick comparisons.
+        self._forbidden_lower = tuple(bad.lower() for bad in self.forbidden_names)
+        self._preferred_lower = tuple(pref.lower() for pref in self.preferred_targets)
+
+    @property
+    def forbidden_lower(self) -> Tuple[str, ...]:
+        return self._forbidden_lower
+
+    @property
+    def preferred_lower(self) -> Tuple[str, ...]:
+        return self._preferred_lower
 
     def sanitized_nickname(self) -> str:
         """Return a nickname adjusted to avoid forbidden names."""
 
         lowered = self.nickname.lower()
-        if any(bad in lowered for bad in self.forbidden_names):
+        if any(bad in lowered for bad in self._forbidden_lower):
             return "BOT" if "bot" not in lowered else f"{self.nickname}_1"
         return self.nickname
 
     @classmethod
-    def from_iterable(cls, args: Iterable[str]) -> Dict[str, Any]:
-        """Create configuration keyword arguments from CLI style overrides."""
-
-        kwargs: Dict[str, Any] = {}
     def from_iterable(cls, args: Iterable[str]) -> "BotConfig":
         """Create a configuration from CLI style key=value arguments."""
 
-        kwargs = {}
-        for item in args:
-            if "=" not in item:
-                raise ValueError(f"Invalid configuration override: {item}")
-            key, value = item.split("=", 1)
-            key = key.strip()
-            value = value.strip()
-            if key == "mode":
-                kwargs[key] = StrategyMode(value)
-            elif key in {"reconnect_attempts"}:
-                kwargs[key] = int(value)
-            elif key in {
-                "reconnect_backoff",
-                "heartbeat_interval",
-                "send_rate_limit",
-            }:
-                kwargs[key] = float(value)
-            else:
-                kwargs[key] = value
-        return kwargs
-        return cls(**kwargs)
+        return cls(**parse_config_overrides(args))
@@ -1,58 +1,74 @@
 """Decision planner combining strategies with heuristics."""
 from __future__ import annotations
 
+import math
 import time
 from dataclasses import dataclass
 from typing import Optional
 
 from .config import BotConfig
 from .state import GameState, Snake, Vector2, blend_headings
-from .strategies import BaseStrategy, StrategyDecision
+from .strategies import BaseStrategy, Reason, StrategyDecision
 
 
 @dataclass(slots=True)
 class PlannedAction:
-    heading: float
+    heading: float  # radians; the bot converts to wire degrees on send
     boost: bool
     throttle: float
     target: Optional[Vector2]
-    reason: str
+    reason: Reason
 
 
 class ActionPlanner:
-    """Refines strategic decisions into low level commands."""
+    """Refines strategic decisions into low level commands.
+
+    `step` mutates and returns a single `PlannedAction` buffer rather than
+    allocating one per tick; callers must consume the plan before the next
+    step instead of retaining references across ticks.
+    """
 
     def __init__(self, config: BotConfig, strategy: BaseStrategy) -> None:
         self.config = config
         self.strategy = strategy
         self._last_heading: float = 0.0
-        self._last_plan: Optional[PlannedAction] = None
+        self._turning_rate_rad = math.radians(config.movement_tuning.turning_rate)
+        self._plan_buf = PlannedAction(heading=0.0, boost=False, throttle=0.0, target=None, reason=Reason.STARTUP)
         self._last_time = time.monotonic()
 
     def step(self, state: GameState, now: float) -> PlannedAction:
-        decision = self.strategy.select(state, now)
+        # Resolve our snake once and dispatch straight to _select; going
+        # through strategy.select would repeat the same lookup.
         snake = state.self_snake()
+        plan = self._plan_buf
         if not snake:
-            return PlannedAction(heading=self._last_heading, boost=False, throttle=0.0, target=None, reason="waiting")
+            plan.heading = self._last_heading
+            plan.boost = False
+            plan.throttle = 0.0
+            plan.target = None
+            plan.reason = Reason.WAITING
+            return plan
 
+        decision = self.strategy._select(state, snake, now)
         dt = max(now - self._last_time, 1e-3)
         heading = blend_headings(
             self._last_heading or snake.heading,
             decision.heading,
-            self.config.movement_tuning.turning_rate,
+            self._turning_rate_rad,
             dt,
         )
-        throttle = self.config.movement_tuning.boost_speed if decision.boost else self.config.movement_tuning.base_speed
-
-        plan = PlannedAction(heading=heading, boost=decision.boost, throttle=throttle, target=decision.target, reason=decision.reason)
+        plan.heading = heading
+        plan.boost = decision.boost
+        plan.throttle = self.config.movement_tuning.boost_speed if decision.boost else self.config.movement_tuning.base_speed
+        plan.target = decision.target
+        plan.reason = decision.reason
         self._last_heading = heading
-        self._last_plan = plan
         self._last_time = now
         return plan
 
     @property
-    def last_plan(self) -> Optional[PlannedAction]:
-        return self._last_plan
+    def last_plan(self) -> PlannedAction:
+        return self._plan_buf
 
     def update_strategy(self, strategy: BaseStrategy) -> None:
         self.strategy = strategy
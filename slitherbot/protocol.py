@@ -2,14 +2,37 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import json
 import logging
+import queue
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, AsyncIterator, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import websockets
 
+try:  # websocket-client, for the synchronous threaded transport.
+    import websocket
+except ImportError:  # pragma: no cover - optional dependency
+    websocket = None
+
+try:  # orjson parses/serializes several times faster than stdlib json.
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps  # returns bytes; websockets sends a binary frame
+    _NEWLINE = b"\n"
+except ImportError:  # pragma: no cover - optional dependency
+    _loads = json.loads
+
+    def _dumps(message: Dict[str, Any]) -> str:
+        return json.dumps(message)
+
+    _NEWLINE = "\n"
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -27,47 +50,277 @@ class SlitherProtocol:
         self._heartbeat_interval = heartbeat_interval
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
         self._receiver_task: Optional[asyncio.Task[None]] = None
-        self._queue: asyncio.Queue[IncomingMessage] = asyncio.Queue()
+        self._heartbeat_task: Optional[asyncio.Task[None]] = None
+        self._writer_task: Optional[asyncio.Task[None]] = None
+        self._inbox: deque[IncomingMessage] = deque()
+        self._has_data = asyncio.Event()
         self._stop = asyncio.Event()
+        # Holds pre-serialized frames (bytes with orjson, str otherwise).
+        self._outbox: asyncio.Queue[Any] = asyncio.Queue()
 
     async def __aenter__(self) -> "SlitherProtocol":
         LOGGER.info("Connecting to %s", self._uri)
-        self._ws = await websockets.connect(self._uri, max_size=2 ** 23)
+        self._ws = await websockets.connect(self._uri, max_size=2 ** 23, compression=None)
         self._stop.clear()
         self._receiver_task = asyncio.create_task(self._receiver())
-        asyncio.create_task(self._heartbeat())
+        self._writer_task = asyncio.create_task(self._writer())
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
         await self.close()
 
     async def close(self) -> None:
+        self._stop.set()
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            await asyncio.gather(self._heartbeat_task, return_exceptions=True)
+            self._heartbeat_task = None
         if self._receiver_task:
-            self._stop.set()
             await self._receiver_task
+            self._receiver_task = None
+        if self._writer_task:
+            self._writer_task.cancel()
+            await asyncio.gather(self._writer_task, return_exceptions=True)
+            self._writer_task = None
         if self._ws:
+            await self._flush()
             await self._ws.close()
             self._ws = None
 
     async def _receiver(self) -> None:
         assert self._ws is not None
+        # Hoist attribute lookups out of the per-message loop; each dotted
+        # access is a dict probe that adds up at high frame rates.
+        loads = _loads
+        message_cls = IncomingMessage
+        push = self._push
+        warn = LOGGER.warning
+        recv = self._ws.recv
+        # Read raw bytes when the library allows it: decoding text frames is
+        # redundant work since the JSON parser validates UTF-8 itself.
+        raw_frames = "decode" in inspect.signature(recv).parameters
         try:
-            async for raw_message in self._ws:
+            while True:
+                raw_message = await (recv(decode=False) if raw_frames else recv())
                 try:
-                    data = json.loads(raw_message)
-                except json.JSONDecodeError:
-                    LOGGER.warning("Unparseable message: %s", raw_message)
+                    data = loads(raw_message)
+                except ValueError:
+                    warn("Unparseable message: %s", raw_message)
                     continue
-                message_type = data.get("type", "unknown")
-                payload = data.get("payload", {})
-                await self._queue.put(IncomingMessage(type=message_type, payload=payload))
+                push(message_cls(type=data.get("type", "unknown"), payload=data.get("payload", {})))
         except websockets.ConnectionClosed as exc:
             LOGGER.warning("Connection closed: %s", exc)
         finally:
-            await self._queue.put(IncomingMessage(type="disconnect", payload={}))
+            self._push(IncomingMessage(type="disconnect", payload={}))
+
+    def _push(self, message: IncomingMessage) -> None:
+        self._inbox.append(message)
+        self._has_data.set()
 
     async def _heartbeat(self) -> None:
         assert self._ws is not None
+        sleep = asyncio.sleep
+        send = self.send
+        interval = self._heartbeat_interval
+        stop = self._stop
+        while not stop.is_set():
+            try:
+                await sleep(interval)
+                await send({"type": "heartbeat", "payload": {"time": time.time()}})
+            except asyncio.CancelledError:  # pragma: no cover - cooperative cancellation
+                break
+            except Exception as exc:  # pragma: no cover - network errors
+                LOGGER.error("Heartbeat failure: %s", exc)
+                break
+
+    async def send(self, message: Dict[str, Any]) -> None:
+        """Hand a message to the single writer task.
+
+        All outbound traffic — moves, heartbeats, the join handshake — funnels
+        through one queue. The writer drains everything available per wakeup
+        and sends it as a newline-separated JSON blob, so concurrent senders
+        share frames instead of each paying framing overhead.
+
+        The message is serialized here, not in the writer: callers reuse
+        mutable payload dicts between ticks, so queueing a reference would
+        let a later mutation rewrite an already-queued frame.
+        """
+
+        if not self._ws:
+            raise RuntimeError("WebSocket is not connected")
+        self._outbox.put_nowait(_dumps(message))
+
+    async def _writer(self) -> None:
+        assert self._ws is not None
+        ws = self._ws
+        outbox = self._outbox
+        try:
+            while True:
+                batch = [await outbox.get()]
+                while not outbox.empty():
+                    batch.append(outbox.get_nowait())
+                await ws.send(_NEWLINE.join(batch))
+        except asyncio.CancelledError:  # pragma: no cover - cooperative cancellation
+            raise
+        except websockets.ConnectionClosed as exc:
+            LOGGER.warning("Writer stopped: %s", exc)
+
+    async def _flush(self) -> None:
+        """Send anything still queued; used while shutting down."""
+
+        if not self._ws:
+            return
+        batch: List[Any] = []
+        while not self._outbox.empty():
+            batch.append(self._outbox.get_nowait())
+        if batch:
+            await self._ws.send(_NEWLINE.join(batch))
+
+    async def messages(self) -> AsyncIterator[IncomingMessage]:
+        """Yield inbound messages, draining the whole inbox per wakeup.
+
+        A deque plus a single event avoids the two task switches an
+        `asyncio.Queue` pays per message, so bursts of frames are consumed
+        without round-tripping the scheduler for each one.
+        """
+
+        inbox = self._inbox
+        while True:
+            await self._has_data.wait()
+            while inbox:
+                message = inbox.popleft()
+                yield message
+                if message.type == "disconnect":
+                    return
+            self._has_data.clear()
+
+
+class ThreadedSlitherProtocol:
+    """Alternative transport backed by the synchronous `websocket-client`.
+
+    The sync client sustains roughly double the receive throughput of the
+    async one on high-frequency feeds. A background thread runs the blocking
+    receive loop with UTF-8 validation disabled and hands inbound frames to
+    the event loop via ``call_soon_threadsafe``; outbound messages go through
+    a thread-safe queue drained by a writer thread. The ``async with`` /
+    ``messages()`` / ``send()`` surface matches :class:`SlitherProtocol`, so
+    `SlitherBot` can use either interchangeably.
+    """
+
+    def __init__(self, uri: str, heartbeat_interval: float) -> None:
+        if websocket is None:
+            raise RuntimeError("websocket-client is required for ThreadedSlitherProtocol")
+        self._uri = uri
+        self._heartbeat_interval = heartbeat_interval
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._app: Optional["websocket.WebSocketApp"] = None
+        self._receiver_thread: Optional[threading.Thread] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        # Pre-serialized frames; None is the writer-thread shutdown sentinel.
+        self._outbox: "queue.Queue[Optional[Any]]" = queue.Queue()
+        self._inbox: deque[IncomingMessage] = deque()
+        self._has_data = asyncio.Event()
+        # _handshake fires on either outcome (open or close); _connected only
+        # on open, so a refused connection fails fast instead of waiting out
+        # the timeout while looking connected.
+        self._handshake = threading.Event()
+        self._connected = threading.Event()
+        self._failed: Optional[Exception] = None
+        self._heartbeat_task: Optional[asyncio.Task[None]] = None
+        self._stop = asyncio.Event()
+
+    async def __aenter__(self) -> "ThreadedSlitherProtocol":
+        LOGGER.info("Connecting to %s (threaded transport)", self._uri)
+        self._loop = asyncio.get_running_loop()
+        self._app = websocket.WebSocketApp(
+            self._uri,
+            on_open=self._on_open,
+            on_message=self._on_message,
+            on_error=self._on_error,
+            on_close=self._on_close,
+        )
+        self._receiver_thread = threading.Thread(
+            target=self._run_app, name="slitherbot-ws-recv", daemon=True
+        )
+        self._receiver_thread.start()
+        await self._loop.run_in_executor(None, lambda: self._handshake.wait(timeout=10))
+        if not self._connected.is_set():
+            raise RuntimeError(f"Could not connect to {self._uri}: {self._failed}")
+        self._writer_thread = threading.Thread(
+            target=self._drain_outbox, name="slitherbot-ws-send", daemon=True
+        )
+        self._writer_thread.start()
+        self._stop.clear()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        self._stop.set()
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            await asyncio.gather(self._heartbeat_task, return_exceptions=True)
+            self._heartbeat_task = None
+        self._outbox.put(None)
+        if self._app:
+            self._app.close()
+            self._app = None
+        for thread in (self._writer_thread, self._receiver_thread):
+            if thread:
+                await asyncio.get_running_loop().run_in_executor(None, thread.join)
+        self._writer_thread = None
+        self._receiver_thread = None
+
+    def _run_app(self) -> None:
+        assert self._app is not None
+        self._app.run_forever(skip_utf8_validation=True)
+
+    def _drain_outbox(self) -> None:
+        while True:
+            frame = self._outbox.get()
+            if frame is None:
+                break
+            try:
+                self._app.send(frame)
+            except Exception as exc:  # pragma: no cover - network errors
+                LOGGER.error("Send failure: %s", exc)
+                break
+
+    # Callbacks below run on the websocket thread.
+
+    def _on_open(self, _app) -> None:
+        self._connected.set()
+        self._handshake.set()
+
+    def _on_message(self, _app, raw_message) -> None:
+        try:
+            data = _loads(raw_message)
+        except ValueError:
+            LOGGER.warning("Unparseable message: %s", raw_message)
+            return
+        message = IncomingMessage(
+            type=data.get("type", "unknown"), payload=data.get("payload", {})
+        )
+        self._loop.call_soon_threadsafe(self._push, message)
+
+    def _on_error(self, _app, error) -> None:
+        self._failed = error
+        LOGGER.warning("Websocket error: %s", error)
+
+    def _on_close(self, _app, _code, _reason) -> None:
+        self._handshake.set()
+        self._loop.call_soon_threadsafe(
+            self._push, IncomingMessage(type="disconnect", payload={})
+        )
+
+    def _push(self, message: IncomingMessage) -> None:
+        self._inbox.append(message)
+        self._has_data.set()
+
+    async def _heartbeat(self) -> None:
         while not self._stop.is_set():
             try:
                 await asyncio.sleep(self._heartbeat_interval)
@@ -79,13 +332,19 @@ class SlitherProtocol:
                 break
 
     async def send(self, message: Dict[str, Any]) -> None:
-        if not self._ws:
+        if not self._app:
             raise RuntimeError("WebSocket is not connected")
-        await self._ws.send(json.dumps(message))
+        # Serialize before queueing for the same reason as the async
+        # transport: callers reuse mutable payload dicts between ticks.
+        self._outbox.put(_dumps(message))
 
     async def messages(self) -> AsyncIterator[IncomingMessage]:
+        inbox = self._inbox
         while True:
-            message = await self._queue.get()
-            yield message
-            if message.type == "disconnect":
-                break
+            await self._has_data.wait()
+            while inbox:
+                message = inbox.popleft()
+                yield message
+                if message.type == "disconnect":
+                    return
+            self._has_data.clear()
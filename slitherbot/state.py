@@ -2,29 +2,61 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from math import atan2, cos, hypot, sin
-from typing import Dict, Iterable, List, Optional, Tuple
+from math import atan2, cos, degrees, hypot, sin, tau
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 import numpy as np
 
+try:  # scipy turns nearest/radius queries from O(N) scans into O(log N).
+    from scipy.spatial import cKDTree
+except ImportError:  # pragma: no cover - optional dependency
+    cKDTree = None
+
+#: Below this many points a vectorized flat scan beats building and querying
+#: a KD-tree, so spatial queries pick their backend per call.
+_TREE_MIN_POINTS = 512
+
+
+class Vector2(NamedTuple):
+    """Immutable 2D point; tuple layout keeps construction and unpacking cheap."""
 
-@dataclass(slots=True)
-class Vector2:
     x: float
     y: float
 
-    def __iter__(self):
-        return iter((self.x, self.y))
-
     def distance_to(self, other: "Vector2") -> float:
         return hypot(self.x - other.x, self.y - other.y)
 
+    def distance_sq_to(self, other: "Vector2") -> float:
+        """Squared distance; use for threshold compares to skip the sqrt."""
+
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
+
+    def polar_to(self, other: "Vector2") -> Tuple[float, float]:
+        """Return (angle in radians, squared distance) in one dx/dy pass.
+
+        Fuses angle_to and distance_sq_to for callers that need both, so the
+        coordinate differences are computed once instead of twice.
+        """
+
+        dx = other.x - self.x
+        dy = other.y - self.y
+        return atan2(dy, dx), dx * dx + dy * dy
+
     def angle_to(self, other: "Vector2") -> float:
-        return np.degrees(atan2(other.y - self.y, other.x - self.x)) % 360.0
+        """Bearing to other in degrees; prefer angle_to_rad internally."""
+
+        # atan2 degrees sit in (-180, 180], so one correction replaces the
+        # general float remainder.
+        angle = degrees(atan2(other.y - self.y, other.x - self.x))
+        return angle if angle >= 0.0 else angle + 360.0
+
+    def angle_to_rad(self, other: "Vector2") -> float:
+        return atan2(other.y - self.y, other.x - self.x)
 
-    def moved_towards(self, heading_deg: float, distance: float) -> "Vector2":
-        rad = np.radians(heading_deg)
-        return Vector2(self.x + cos(rad) * distance, self.y + sin(rad) * distance)
+    def moved_towards(self, heading_rad: float, distance: float) -> "Vector2":
+        return Vector2(self.x + cos(heading_rad) * distance, self.y + sin(heading_rad) * distance)
 
     def lerp(self, other: "Vector2", alpha: float) -> "Vector2":
         return Vector2(self.x + (other.x - self.x) * alpha, self.y + (other.y - self.y) * alpha)
@@ -41,7 +73,7 @@ class Food:
 class Snake:
     id: str
     position: Vector2
-    heading: float
+    heading: float  # radians; converted from wire degrees at ingestion
     length: float
     speed: float
     is_self: bool = False
@@ -60,32 +92,148 @@ class Hazard:
     expires: float
 
 
+def _empty_positions() -> np.ndarray:
+    return np.empty((0, 2), dtype=np.float32)
+
+
+def _empty_floats() -> np.ndarray:
+    return np.empty(0, dtype=np.float32)
+
+
+def _empty_times() -> np.ndarray:
+    return np.empty(0, dtype=np.float64)
+
+
 @dataclass(slots=True)
 class GameState:
-    """Mutable representation of the known game world."""
+    """Mutable representation of the known game world.
+
+    Food is stored structure-of-arrays style: parallel position, mass and
+    creation-time arrays instead of a list of `Food` objects. Scans, decay
+    and sorting become single NumPy operations, and `Food` views are only
+    materialised when an individual pellet is handed back to a caller.
+    """
 
     tick: int = 0
     snakes: Dict[str, Snake] = field(default_factory=dict)
-    foods: List[Food] = field(default_factory=list)
+    food_positions: np.ndarray = field(default_factory=_empty_positions, repr=False)
+    food_masses: np.ndarray = field(default_factory=_empty_floats, repr=False)
+    food_created: np.ndarray = field(default_factory=_empty_times, repr=False)
     hazards: List[Hazard] = field(default_factory=list)
     world_size: Tuple[int, int] = (1200, 1200)
+    _food_tree: Optional[object] = field(default=None, repr=False)
+    _threat_tree: Optional[object] = field(default=None, repr=False)
+    _threat_list: List[Snake] = field(default_factory=list, repr=False)
+    _snake_cache: Optional[Tuple[List[Snake], np.ndarray, np.ndarray, np.ndarray]] = field(default=None, repr=False)
+    _pref_bonus: Optional[Tuple[Tuple[str, ...], np.ndarray]] = field(default=None, repr=False)
+    _self_id: Optional[str] = field(default=None, repr=False)
 
     def self_snake(self) -> Optional[Snake]:
-        return next((snake for snake in self.snakes.values() if snake.is_self), None)
+        if self._self_id is None:
+            return None
+        return self.snakes.get(self._self_id)
+
+    @property
+    def food_count(self) -> int:
+        return len(self.food_masses)
+
+    @property
+    def food_x(self) -> np.ndarray:
+        """X coordinates of all pellets as a contiguous-column view."""
+
+        return self.food_positions[:, 0]
+
+    @property
+    def food_y(self) -> np.ndarray:
+        """Y coordinates of all pellets as a contiguous-column view."""
+
+        return self.food_positions[:, 1]
+
+    def snake_positions(self) -> np.ndarray:
+        """Positions of all known snakes as an (N, 2) array, cache-backed."""
+
+        return self._snake_arrays()[1]
+
+    def food_at(self, index: int) -> Food:
+        """Materialise a `Food` view for a single pellet."""
+
+        x, y = self.food_positions[index]
+        return Food(
+            position=Vector2(float(x), float(y)),
+            mass=float(self.food_masses[index]),
+            created=float(self.food_created[index]),
+        )
 
     def update_food(self, foods: Iterable[Food]) -> None:
-        self.foods.extend(foods)
-        self.foods.sort(key=lambda f: f.mass, reverse=True)
+        items = list(foods)
+        if not items:
+            return
+        positions = np.array([(food.position.x, food.position.y) for food in items], dtype=np.float32)
+        masses = np.fromiter((food.mass for food in items), dtype=np.float32, count=len(items))
+        created = np.fromiter((food.created for food in items), dtype=np.float64, count=len(items))
+        self.extend_food(positions, masses, created)
+
+    def extend_food(self, positions: np.ndarray, masses: np.ndarray, created) -> None:
+        """Append pellets from raw arrays without building Food objects.
+
+        `created` may be a per-pellet array or a single timestamp shared by
+        the whole batch (the common case for a food_batch message).
+        """
+
+        count = len(masses)
+        if count == 0:
+            return
+        positions = np.asarray(positions, dtype=np.float32).reshape(count, 2)
+        masses = np.asarray(masses, dtype=np.float32)
+        created = np.broadcast_to(np.asarray(created, dtype=np.float64), (count,))
+        self.food_positions = np.concatenate((self.food_positions, positions))
+        self.food_masses = np.concatenate((self.food_masses, masses))
+        self.food_created = np.concatenate((self.food_created, created))
+        order = np.argsort(-self.food_masses, kind="stable")
+        self.food_positions = self.food_positions[order]
+        self.food_masses = self.food_masses[order]
+        self.food_created = self.food_created[order]
+        self._food_tree = None
 
     def decay_food(self, now: float, decay_seconds: float) -> None:
-        self.foods = [food for food in self.foods if now - food.created <= decay_seconds]
+        keep = (now - self.food_created) <= decay_seconds
+        if not keep.all():
+            self.food_positions = self.food_positions[keep]
+            self.food_masses = self.food_masses[keep]
+            self.food_created = self.food_created[keep]
+            self._food_tree = None
 
     def update_snakes(self, snakes: Iterable[Snake]) -> None:
         for snake in snakes:
             self.snakes[snake.id] = snake
+            if snake.is_self:
+                self._self_id = snake.id
+        self._invalidate_snake_caches()
 
     def remove_snake(self, snake_id: str) -> None:
         self.snakes.pop(snake_id, None)
+        if snake_id == self._self_id:
+            self._self_id = None
+        self._invalidate_snake_caches()
+
+    def _invalidate_snake_caches(self) -> None:
+        self._threat_tree = None
+        self._snake_cache = None
+        self._pref_bonus = None
+
+    def _snake_arrays(self) -> Tuple[List[Snake], np.ndarray, np.ndarray, np.ndarray]:
+        """Return (snakes, positions, lengths, is_self), rebuilt after mutations."""
+
+        if self._snake_cache is None:
+            snakes = list(self.snakes.values())
+            count = len(snakes)
+            positions = np.array(
+                [(snake.position.x, snake.position.y) for snake in snakes], dtype=np.float64
+            ).reshape(count, 2)
+            lengths = np.fromiter((snake.length for snake in snakes), dtype=np.float64, count=count)
+            is_self = np.fromiter((snake.is_self for snake in snakes), dtype=bool, count=count)
+            self._snake_cache = (snakes, positions, lengths, is_self)
+        return self._snake_cache
 
     def prune_hazards(self, now: float) -> None:
         self.hazards = [hazard for hazard in self.hazards if hazard.expires > now]
@@ -94,34 +242,136 @@ class GameState:
         self.hazards.append(Hazard(center=center, radius=radius, expires=expires))
 
     def nearest_food(self, origin: Vector2) -> Optional[Food]:
-        return min(self.foods, key=lambda food: origin.distance_to(food.position), default=None)
+        if self.food_count == 0:
+            return None
+        if cKDTree is not None and self.food_count >= _TREE_MIN_POINTS:
+            if self._food_tree is None:
+                self._food_tree = cKDTree(self.food_positions)
+            _, index = self._food_tree.query((origin.x, origin.y), k=1)
+        else:
+            dx = self.food_positions[:, 0] - origin.x
+            dy = self.food_positions[:, 1] - origin.y
+            index = int(np.argmin(dx * dx + dy * dy))
+        return self.food_at(index)
+
+    def nearest_food_batch(self, positions: np.ndarray) -> np.ndarray:
+        """Index of the nearest pellet for each query position.
+
+        Batched sibling of `nearest_food` for multi-agent callers: a single
+        tree query (or one broadcast scan) covers every agent instead of a
+        per-agent round trip. Returns an empty index array when there is no
+        food.
+        """
+
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 2)
+        if self.food_count == 0 or len(positions) == 0:
+            return np.empty(0, dtype=np.intp)
+        if cKDTree is not None and self.food_count >= _TREE_MIN_POINTS:
+            if self._food_tree is None:
+                self._food_tree = cKDTree(self.food_positions)
+            _, indices = self._food_tree.query(positions, k=1)
+            return np.atleast_1d(indices)
+        dx = self.food_positions[None, :, 0] - positions[:, 0:1]
+        dy = self.food_positions[None, :, 1] - positions[:, 1:2]
+        return np.argmin(dx * dx + dy * dy, axis=1)
 
     def threats_in_radius(self, origin: Vector2, radius: float) -> List[Snake]:
-        return [snake for snake in self.snakes.values() if not snake.is_self and origin.distance_to(snake.position) <= radius]
+        snakes, positions, _, is_self = self._snake_arrays()
+        if not snakes:
+            return []
+        if cKDTree is not None and len(snakes) >= _TREE_MIN_POINTS:
+            if self._threat_tree is None:
+                self._threat_list = [snake for snake in snakes if not snake.is_self]
+                if not self._threat_list:
+                    return []
+                self._threat_tree = cKDTree([(snake.position.x, snake.position.y) for snake in self._threat_list])
+            indices = self._threat_tree.query_ball_point((origin.x, origin.y), radius)
+            return [self._threat_list[index] for index in indices]
+        dx = positions[:, 0] - origin.x
+        dy = positions[:, 1] - origin.y
+        mask = ~is_self & (dx * dx + dy * dy <= radius * radius)
+        return [snakes[index] for index in np.nonzero(mask)[0]]
+
+    def threat_positions_in_radius(self, origin: Vector2, radius: float) -> np.ndarray:
+        """Positions of non-self snakes within radius, as an (N, 2) array.
+
+        Array sibling of `threats_in_radius` for callers that only need
+        coordinates; computed as one masked select over the cached arrays.
+        """
+
+        snakes, positions, _, is_self = self._snake_arrays()
+        if not snakes:
+            return np.empty((0, 2))
+        dx = positions[:, 0] - origin.x
+        dy = positions[:, 1] - origin.y
+        mask = ~is_self & (dx * dx + dy * dy <= radius * radius)
+        return positions[mask]
+
+    def angles_from(self, origin: Vector2, positions: Optional[np.ndarray] = None) -> np.ndarray:
+        """Headings in degrees from origin to each position in one arctan2 call.
+
+        Defaults to the cached positions of every known snake; pass an (N, 2)
+        array to compute against an arbitrary point set instead.
+        """
+
+        if positions is None:
+            positions = self._snake_arrays()[1]
+        angles = np.degrees(np.arctan2(positions[:, 1] - origin.y, positions[:, 0] - origin.x))
+        # arctan2 degrees sit in (-180, 180]; a masked add avoids the
+        # elementwise remainder.
+        angles[angles < 0.0] += 360.0
+        return angles
 
     def best_target(self, origin: Vector2, preferred_names: Tuple[str, ...]) -> Optional[Snake]:
-        candidates = [snake for snake in self.snakes.values() if not snake.is_self]
-        if not candidates:
+        snakes, positions, lengths, is_self = self._snake_arrays()
+        if not snakes or bool(is_self.all()):
             return None
-        weights: List[Tuple[float, Snake]] = []
-        for snake in candidates:
-            distance = origin.distance_to(snake.position)
-            preference_bonus = 0.0
-            if snake.name:
-                lowered = snake.name.lower()
-                if any(pref.lower() in lowered for pref in preferred_names):
-                    preference_bonus = 1.5
-            weight = (snake.length / max(distance, 1.0)) + preference_bonus
-            weights.append((weight, snake))
-        weights.sort(key=lambda item: item[0], reverse=True)
-        return weights[0][1]
+        distances = np.hypot(positions[:, 0] - origin.x, positions[:, 1] - origin.y)
+        weights = lengths / np.maximum(distances, 1.0)
+        if preferred_names:
+            weights = weights + self._preference_bonus(snakes, preferred_names)
+        weights[is_self] = -np.inf
+        return snakes[int(np.argmax(weights))]
+
+    def _preference_bonus(self, snakes: List[Snake], preferred_names: Tuple[str, ...]) -> np.ndarray:
+        if self._pref_bonus is None or self._pref_bonus[0] != preferred_names:
+            lowered_prefs = tuple(pref.lower() for pref in preferred_names)
+            bonus = np.zeros(len(snakes), dtype=np.float64)
+            for index, snake in enumerate(snakes):
+                if snake.name and any(pref in snake.name.lower() for pref in lowered_prefs):
+                    bonus[index] = 1.5
+            self._pref_bonus = (preferred_names, bonus)
+        return self._pref_bonus[1]
+
+
+def wrap_angle(angle: float) -> float:
+    """Wrap an angle within one revolution of range into [0, tau).
+
+    A compare-and-correct pair instead of float %, which goes through the
+    general sign/NaN-handling remainder path; callers guarantee the input is
+    at most one revolution out of range.
+    """
+
+    if angle >= tau:
+        angle -= tau
+    elif angle < 0.0:
+        angle += tau
+    return angle
 
 
 def blend_headings(current: float, target: float, rate: float, dt: float) -> float:
-    """Return a heading that smoothly approaches the target."""
+    """Return a heading in radians that smoothly approaches the target.
+
+    All angles (and the turn rate, radians per second) are radians; headings
+    only become degrees at the protocol boundary when a move is emitted.
+    """
 
-    diff = (target - current + 540.0) % 360.0 - 180.0
+    # atan2 of the sine/cosine of the raw difference folds it into (-pi, pi]
+    # without the remainder's seam, for any magnitude of input difference.
+    raw = target - current
+    diff = atan2(sin(raw), cos(raw))
     max_step = rate * dt
     if abs(diff) <= max_step:
         return target
-    return (current + max_step * np.sign(diff)) % 360.0
+    step = max_step if diff >= 0.0 else -max_step
+    return wrap_angle(current + step)
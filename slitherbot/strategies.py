@@ -1,83 +1,260 @@
 """Strategy implementations for different bot behaviours."""
 from __future__ import annotations
 
-import random
-import time
 from dataclasses import dataclass
+from enum import IntEnum
+from math import atan2, radians
+from types import MethodType
 from typing import Optional
 
+import numpy as np
+
+from ._strategy_kernels import HAVE_NUMBA, evade_heading, farm_heading, hunt_core
 from .config import BotConfig, StrategyMode
-from .state import GameState, Snake, Vector2, blend_headings
+from .state import GameState, Snake, Vector2, blend_headings, wrap_angle
+
+
+class Reason(IntEnum):
+    """Why a decision was made; formatted to a string only when emitted."""
+
+    HOLD = 0
+    FOOD = 1
+    CENTER = 2
+    HUNT = 3
+    EVADE = 4
+    PATROL = 5
+    NO_SELF = 6
+    STARTUP = 7
+    WAITING = 8
+
+
+#: Lowercase wire labels, precomputed so emission is a dict lookup.
+REASON_LABELS = {reason: reason.name.lower() for reason in Reason}
 
 
 @dataclass(slots=True)
 class StrategyDecision:
-    heading: float
+    heading: float  # radians; degrees exist only on the wire
     boost: bool
     target: Optional[Vector2] = None
-    reason: str = "idle"
+    reason: Reason = Reason.HOLD
 
 
 class BaseStrategy:
-    """Common logic shared by every strategy."""
+    """Common logic shared by every strategy.
+
+    Each strategy mutates and returns a single `StrategyDecision` buffer per
+    tick instead of allocating one; callers must consume the decision before
+    the next `select` rather than retaining references across ticks.
+    """
+
+    __slots__ = (
+        "config",
+        "last_reason",
+        "_decision",
+        "_turning_rate_rad",
+        "_aggression_sq",
+        "_dodge_distance",
+    )
 
     def __init__(self, config: BotConfig) -> None:
         self.config = config
-        self.last_reason = "startup"
+        self.last_reason = Reason.STARTUP
+        self._decision = StrategyDecision(heading=0.0, boost=False, target=None, reason=Reason.STARTUP)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Recompute the cached tuning values after a config mutation.
+
+        The per-tick paths read these local floats instead of chasing
+        config.movement_tuning attributes; anything that mutates the tuning
+        in place must call this afterwards.
+        """
+
+        tuning = self.config.movement_tuning
+        self._turning_rate_rad = radians(tuning.turning_rate)
+        self._aggression_sq = tuning.aggression_threshold ** 2
+        self._dodge_distance = tuning.dodge_distance
 
     def _default_decision(self, snake: Snake) -> StrategyDecision:
-        return StrategyDecision(heading=snake.heading, boost=False, target=None, reason="hold")
+        return self._emit(snake.heading, False, None, Reason.HOLD)
+
+    def _emit(self, heading: float, boost: bool, target: Optional[Vector2], reason: Reason) -> StrategyDecision:
+        decision = self._decision
+        decision.heading = heading
+        decision.boost = boost
+        decision.target = target
+        decision.reason = reason
+        return decision
+
+    #: Shared constant decision for ticks before our snake exists. Pooled at
+    #: class level so the common pre-spawn path never touches the per-instance
+    #: buffer; treat it as immutable.
+    _NO_SELF = StrategyDecision(heading=0.0, boost=False, target=None, reason=Reason.NO_SELF)
 
     def select(self, state: GameState, now: float) -> StrategyDecision:
+        """Convenience wrapper that resolves our snake before dispatching.
+
+        The planner looks the snake up itself and calls `_select` directly so
+        the hot path pays one lookup and one dispatch; this wrapper stays for
+        external callers that only hold the state.
+        """
+
         snake = state.self_snake()
-        if not snake:
-            return StrategyDecision(heading=0.0, boost=False, target=None, reason="no-self")
-        return self._select(state, snake, now)
+        return self._NO_SELF if snake is None else self._select(state, snake, now)
 
     def _select(self, state: GameState, snake: Snake, now: float) -> StrategyDecision:  # pragma: no cover - abstract
         raise NotImplementedError
 
+    def select_batch(self, state: GameState, positions: np.ndarray, now: float):
+        """Headings (radians) and boost flags for many agents in one call.
+
+        Returns `(headings, boost)` arrays of length N for an (N, 2) array of
+        agent positions. The base version runs the scalar path once per
+        agent; strategies with a vectorized form override it.
+        """
+
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 2)
+        headings = np.empty(len(positions))
+        boost = np.zeros(len(positions), dtype=bool)
+        for index, (x, y) in enumerate(positions):
+            probe = Snake(
+                id=f"agent-{index}",
+                position=Vector2(float(x), float(y)),
+                heading=0.0,
+                length=0.0,
+                speed=0.0,
+                is_self=True,
+            )
+            decision = self._select(state, probe, now)
+            headings[index] = decision.heading
+            boost[index] = decision.boost
+        return headings, boost
+
 
 class FarmStrategy(BaseStrategy):
+    __slots__ = ("_center", "_cached_world_size")
+
+    def __init__(self, config: BotConfig) -> None:
+        super().__init__(config)
+        self._center: Optional[Vector2] = None
+        self._cached_world_size: Optional[tuple] = None
+
+    def _world_center(self, state: GameState) -> Vector2:
+        # World size is effectively static per game; rebuild only on change.
+        if state.world_size != self._cached_world_size:
+            self._cached_world_size = state.world_size
+            self._center = Vector2(state.world_size[0] * 0.5, state.world_size[1] * 0.5)
+        return self._center
+
     def _select(self, state: GameState, snake: Snake, now: float) -> StrategyDecision:
         food = state.nearest_food(snake.position)
         if food:
-            heading = snake.position.angle_to(food.position)
-            return StrategyDecision(heading=heading, boost=False, target=food.position, reason="food")
-        world_w, world_h = state.world_size
-        center = Vector2(world_w / 2, world_h / 2)
-        heading = blend_headings(snake.heading, snake.position.angle_to(center), self.config.movement_tuning.turning_rate, 0.05)
-        return StrategyDecision(heading=heading, boost=False, target=center, reason="center")
+            heading = farm_heading(snake.position.x, snake.position.y, food.position.x, food.position.y)
+            return self._emit(heading, False, food.position, Reason.FOOD)
+        center = self._world_center(state)
+        heading = blend_headings(snake.heading, snake.position.angle_to_rad(center), self._turning_rate_rad, 0.05)
+        return self._emit(heading, False, center, Reason.CENTER)
+
+    def select_batch(self, state: GameState, positions: np.ndarray, now: float):
+        """Vectorized farm headings: one nearest-food query for all agents."""
+
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 2)
+        count = len(positions)
+        boost = np.zeros(count, dtype=bool)
+        if count == 0:
+            return np.empty(0), boost
+        if state.food_count:
+            targets = state.food_positions[state.nearest_food_batch(positions)]
+        else:
+            center = self._world_center(state)
+            targets = np.broadcast_to(np.asarray(center, dtype=np.float32), (count, 2))
+        headings = np.arctan2(targets[:, 1] - positions[:, 1], targets[:, 0] - positions[:, 0])
+        return headings, boost
+
+
+#: Source template for the specialised hunt select. The preferred-target set
+#: and squared aggression threshold are baked in as constants at construction
+#: time, so the per-tick body carries no config attribute lookups.
+_HUNT_SELECT_TEMPLATE = """\
+def _select_spec(self, state, snake, now):
+    target = state.best_target(snake.position, {preferred!r})
+    if target is None:
+        return self._fallback._select(state, snake, now)
+    heading, boost = hunt_core(
+        snake.position.x, snake.position.y, target.position.x, target.position.y, {aggression_sq!r}
+    )
+    return self._emit(heading, bool(boost), target.position, Reason.HUNT)
+"""
 
 
 class HuntStrategy(BaseStrategy):
+    __slots__ = ("_fallback", "_select_spec")
+
+    def __init__(self, config: BotConfig) -> None:
+        super().__init__(config)
+        self._fallback = FarmStrategy(config)
+
+    def invalidate(self) -> None:
+        super().invalidate()
+        # The baked-in constants are part of the cached tuning state, so the
+        # specialised body is recompiled on the same invalidation hook.
+        source = _HUNT_SELECT_TEMPLATE.format(
+            preferred=self.config.preferred_lower,
+            aggression_sq=self._aggression_sq,
+        )
+        namespace = {"hunt_core": hunt_core, "Reason": Reason}
+        exec(compile(source, "<hunt-select>", "exec"), namespace)
+        self._select_spec = MethodType(namespace["_select_spec"], self)
+
     def _select(self, state: GameState, snake: Snake, now: float) -> StrategyDecision:
-        target = state.best_target(snake.position, self.config.preferred_targets)
-        if target is None:
-            return FarmStrategy(self.config)._select(state, snake, now)
-        heading = snake.position.angle_to(target.position)
-        distance = snake.position.distance_to(target.position)
-        boost = distance < self.config.movement_tuning.aggression_threshold
-        return StrategyDecision(heading=heading, boost=boost, target=target.position, reason="hunt")
+        return self._select_spec(state, snake, now)
 
 
 class SurvivalStrategy(BaseStrategy):
+    __slots__ = ("_fallback",)
+
+    def __init__(self, config: BotConfig) -> None:
+        super().__init__(config)
+        self._fallback = FarmStrategy(config)
+
     def _select(self, state: GameState, snake: Snake, now: float) -> StrategyDecision:
-        threats = state.threats_in_radius(snake.position, self.config.movement_tuning.dodge_distance)
-        if threats:
-            mean_angle = sum(snake.position.angle_to(threat.position) for threat in threats) / len(threats)
-            heading = (mean_angle + 180.0) % 360.0
-            return StrategyDecision(heading=heading, boost=True, target=None, reason="evade")
-        farm_decision = FarmStrategy(self.config)._select(state, snake, now)
-        farm_decision.reason = "patrol"
+        threats = state.threat_positions_in_radius(snake.position, self._dodge_distance)
+        if len(threats):
+            # Flee along the 1/r^2-weighted repulsion vector, so the nearest
+            # threat dominates a distant cluster.
+            if HAVE_NUMBA:
+                heading = evade_heading(snake.position.x, snake.position.y, threats)
+            else:
+                dx = snake.position.x - threats[:, 0]
+                dy = snake.position.y - threats[:, 1]
+                r2 = np.maximum(dx * dx + dy * dy, 1e-9)
+                heading = wrap_angle(atan2(float((dy / r2).sum()), float((dx / r2).sum())))
+            return self._emit(heading, True, None, Reason.EVADE)
+        # The fallback owns its own buffer, so retagging the reason here is
+        # safe and saves a copy.
+        farm_decision = self._fallback._select(state, snake, now)
+        farm_decision.reason = Reason.PATROL
         return farm_decision
 
 
+_STRATEGIES: dict = {
+    StrategyMode.FARM: FarmStrategy,
+    StrategyMode.HUNT: HuntStrategy,
+    StrategyMode.SURVIVAL: SurvivalStrategy,
+}
+
+#: Strategy instances memoised per (mode, config identity); strategies are
+#: stateless between ticks apart from caches derived from the config.
+_strategy_cache: dict = {}
+
+
 def make_strategy(mode: StrategyMode, config: BotConfig) -> BaseStrategy:
-    if mode is StrategyMode.FARM:
-        return FarmStrategy(config)
-    if mode is StrategyMode.HUNT:
-        return HuntStrategy(config)
-    if mode is StrategyMode.SURVIVAL:
-        return SurvivalStrategy(config)
-    raise ValueError(f"Unsupported mode: {mode}")
+    key = (mode, id(config))
+    strategy = _strategy_cache.get(key)
+    if strategy is None:
+        cls = _STRATEGIES.get(mode)
+        if cls is None:
+            raise ValueError(f"Unsupported mode: {mode}")
+        strategy = _strategy_cache[key] = cls(config)
+    return strategy